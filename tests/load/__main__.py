@@ -0,0 +1,53 @@
+"""Soak/load run of the app against a local stub Douyin site
+
+Usage (from the repository root): `python -m tests.load --concurrency 8 --duration 600`
+Exits with code 1 if leaks, memory growth or errors exceed the thresholds.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from randouyin.config.config_logging import setup_logging
+
+from tests.load.harness import run
+from tests.load.report import LoadConfig
+
+
+def parse_args() -> tuple[LoadConfig, str | None]:
+    parser = argparse.ArgumentParser(prog="python -m tests.load", description=__doc__)
+    for name, field in LoadConfig.model_fields.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            dest=name,
+            type=(
+                float
+                if field.annotation is float
+                else int
+                if field.annotation is int
+                else str
+            ),
+            default=field.default,
+            help=f"{field.description or ''} (default: {field.default})",
+        )
+    parser.add_argument("--json", help="Write the full report with memory samples here")
+    args = vars(parser.parse_args())
+    json_path = args.pop("json")
+    return LoadConfig(**args), json_path
+
+
+def main() -> int:
+    setup_logging(log_level="INFO")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    config, json_path = parse_args()
+    report = asyncio.run(run(config))
+    print(report.render())
+    if json_path:
+        with open(json_path, "w") as f:
+            f.write(report.model_dump_json(indent=2))
+    return 1 if report.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
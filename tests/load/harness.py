@@ -0,0 +1,247 @@
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from typing import IO
+
+import psutil
+from httpx import AsyncClient, HTTPError, Timeout
+
+from tests.load.monitor import ProcessTreeMonitor
+from tests.load.report import (
+    MB,
+    LeakCounts,
+    LoadConfig,
+    LoadReport,
+    MemorySample,
+    endpoint_stats,
+)
+from tests.load.stub import StubServer
+
+logger = logging.getLogger("test")
+
+SEARCH = "/search"
+DOWNLOAD = "/video/download"
+QUERIES = ["童笑", "猫", "风景", "美食"]
+
+Results = dict[str, list[tuple[float, bool]]]
+
+
+def start_app(config: LoadConfig, stub_url: str, log: IO | int) -> subprocess.Popen:
+    """Run the real app with uvicorn, pointing scraping URLs to the stub site"""
+    env = {
+        **os.environ,
+        "LOG_LEVEL": "WARNING",
+        "SCRAPING": json.dumps(
+            {
+                "DOUYIN_SEARCH_URL": f"{stub_url}/search/{{query}}",
+                "DOUYIN_VIDEO_URL": f"{stub_url}/video/{{id}}",
+            }
+        ),
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "randouyin.drivers.web.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(config.app_port),
+        ],
+        env=env,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+
+
+def stop_app(app: subprocess.Popen) -> None:
+    """Stop the app and kill whatever it left behind, so the harness leaks nothing"""
+    try:
+        children = psutil.Process(app.pid).children(recursive=True)
+    except psutil.NoSuchProcess:
+        children = []
+    app.terminate()
+    try:
+        app.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        app.kill()
+        app.wait()
+    _, alive = psutil.wait_procs(children, timeout=5)
+    for proc in alive:
+        proc.kill()
+
+
+def port_in_use(port: int) -> bool:
+    with socket.socket() as sock:
+        return sock.connect_ex(("127.0.0.1", port)) == 0
+
+
+def app_exited(app: subprocess.Popen, config: LoadConfig) -> str:
+    log = config.app_log or "not written, rerun with --app-log"
+    return f"App exited with code {app.returncode}, see its log: {log}"
+
+
+async def wait_until_ready(
+    client: AsyncClient, app: subprocess.Popen, config: LoadConfig, timeout: float = 30
+) -> None:
+    """Wait for the spawned app to answer
+
+    The app is polled as well, so that another server left on `--app-port`
+    is not mistaken for it.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if app.poll() is not None:
+            raise RuntimeError(app_exited(app, config))
+        try:
+            response = await client.get("/")
+            if response.is_success:
+                return
+        except HTTPError:
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError("App did not become ready in time")
+        await asyncio.sleep(0.5)
+
+
+async def search(client: AsyncClient, config: LoadConfig) -> None:
+    response = await client.post(SEARCH, data={"query": random.choice(QUERIES)})
+    response.raise_for_status()
+
+
+async def download(client: AsyncClient, config: LoadConfig) -> None:
+    id = random.randint(10**18, 10**19 - 1)
+    size = 0
+    async with client.stream("POST", f"{DOWNLOAD}/{id}") as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+    if size != config.video_size_kb * 1024:
+        raise ValueError(f"Video {id} truncated: {size} bytes")
+
+
+async def drive(client: AsyncClient, config: LoadConfig, duration: float) -> Results:
+    """Keep `concurrency` clients busy for `duration` seconds
+
+    Returns:
+        Results: `(latency in seconds, succeeded)` pairs per endpoint
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration
+    results: Results = {SEARCH: [], DOWNLOAD: []}
+
+    async def worker():
+        while loop.time() < deadline:
+            if random.random() < config.download_ratio:
+                endpoint, request = DOWNLOAD, download
+            else:
+                endpoint, request = SEARCH, search
+            start = loop.time()
+            try:
+                async with asyncio.timeout(config.request_timeout):
+                    await request(client, config)
+                ok = True
+            except Exception as e:
+                logger.debug(f"{endpoint} failed: {e!r}")
+                ok = False
+            results[endpoint].append((loop.time() - start, ok))
+
+    await asyncio.gather(*(worker() for _ in range(config.concurrency)))
+    return results
+
+
+async def sample_memory(
+    monitor: ProcessTreeMonitor,
+    interval: float,
+    samples: list[MemorySample],
+) -> None:
+    """Append memory samples until cancelled, logging progress on the way"""
+    start = time.monotonic()
+    while True:
+        sample = await asyncio.to_thread(monitor.sample, time.monotonic() - start)
+        samples.append(sample)
+        logger.info(
+            f"t={sample.elapsed:.0f}s memory={sample.memory_bytes / MB:.1f}MB "
+            f"processes={sample.processes}"
+        )
+        await asyncio.sleep(interval)
+
+
+async def run(config: LoadConfig) -> LoadReport:
+    """Run the app against the stub site under load and collect a report"""
+    if port_in_use(config.app_port):
+        raise RuntimeError(
+            f"Port {config.app_port} is already in use, stop whatever listens "
+            "on it or pass another --app-port"
+        )
+    with contextlib.ExitStack() as stack:
+        stub = StubServer(config.stub_port, config.video_size_kb * 1024)
+        stub.start()
+        stack.callback(stub.stop)
+        log = (
+            stack.enter_context(open(config.app_log, "w"))
+            if config.app_log
+            else subprocess.DEVNULL
+        )
+        app = start_app(config, stub.url, log)
+        stack.callback(stop_app, app)
+
+        monitor = ProcessTreeMonitor(app.pid, config.stub_port)
+        async with AsyncClient(
+            base_url=f"http://127.0.0.1:{config.app_port}",
+            timeout=Timeout(config.request_timeout),
+        ) as client:
+            await wait_until_ready(client, app, config)
+
+            if config.warmup:
+                logger.info(f"Warming up for {config.warmup}s")
+                await drive(client, config, config.warmup)
+            await asyncio.sleep(config.settle)
+            baseline = await asyncio.to_thread(monitor.sample, 0)
+
+            logger.info(
+                f"Running load for {config.duration}s "
+                f"at concurrency {config.concurrency}"
+            )
+            samples: list[MemorySample] = []
+            sampler = asyncio.create_task(
+                sample_memory(monitor, config.sample_interval, samples)
+            )
+            start = time.monotonic()
+            try:
+                results = await drive(client, config, config.duration)
+            finally:
+                sampler.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await sampler
+            elapsed = time.monotonic() - start
+
+            await asyncio.sleep(config.settle)
+            final = await asyncio.to_thread(monitor.sample, elapsed + config.settle)
+            # A dead app's tree says nothing about leaks, and the app itself
+            # would show up as a zombie of the harness
+            app_error = app_exited(app, config) if app.poll() is not None else None
+            leaks = (
+                await asyncio.to_thread(monitor.leaks)
+                if app_error is None
+                else LeakCounts()
+            )
+
+    return LoadReport(
+        config=config,
+        elapsed=elapsed,
+        endpoints={name: endpoint_stats(r) for name, r in results.items()},
+        baseline_memory=baseline,
+        final_memory=final,
+        samples=samples,
+        leaks=leaks,
+        app_error=app_error,
+    )
@@ -0,0 +1,78 @@
+import psutil
+
+from tests.load.report import LeakCounts, MemorySample
+
+CHROMIUM_NAMES = ("chrome", "chromium", "headless_shell")
+
+
+class ProcessTreeMonitor:
+    """Watches the app process together with its Playwright and Chromium children"""
+
+    def __init__(self, pid: int, upstream_port: int):
+        """
+        Args:
+            pid (int): app process id
+            upstream_port (int): port of the stub Douyin site, connections to it
+                are counted as leaks once the app is idle
+        """
+        self.process = psutil.Process(pid)
+        self.upstream_port = upstream_port
+
+    def tree(self) -> list[psutil.Process]:
+        try:
+            return [self.process, *self.process.children(recursive=True)]
+        except psutil.NoSuchProcess:
+            return []
+
+    def sample(self, elapsed: float) -> MemorySample:
+        """Sum memory of the whole tree
+
+        Chromium processes share most of their pages, so adding up RSS would count
+        them several times. PSS splits shared pages between the processes using
+        them; USS, then RSS are used where PSS is not available.
+        """
+        memory = 0
+        processes = 0
+        for proc in self.tree():
+            try:
+                memory += _memory(proc)
+                processes += 1
+            except psutil.NoSuchProcess:
+                continue
+        return MemorySample(elapsed=elapsed, memory_bytes=memory, processes=processes)
+
+    def leaks(self) -> LeakCounts:
+        """Count resources still held by the app tree, meant to be called when idle"""
+        leaks = LeakCounts()
+        for proc in self.tree():
+            try:
+                if proc.status() == psutil.STATUS_ZOMBIE:
+                    leaks.zombies += 1
+                    continue
+                name = proc.name().lower()
+                cmdline = " ".join(proc.cmdline())
+                leaks.connections += sum(
+                    1
+                    for conn in proc.net_connections(kind="tcp")
+                    if conn.raddr and conn.raddr.port == self.upstream_port
+                )
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+            if "run-driver" in cmdline:
+                leaks.drivers += 1
+            elif any(n in name for n in CHROMIUM_NAMES):
+                # Auxiliary (gpu, zygote, utility...) processes die with the browser
+                if "--type=renderer" in cmdline:
+                    leaks.pages += 1
+                elif "--type=" not in cmdline:
+                    leaks.browsers += 1
+        return leaks
+
+
+def _memory(proc: psutil.Process) -> int:
+    try:
+        info = proc.memory_full_info()
+    except psutil.AccessDenied:
+        return proc.memory_info().rss
+    return getattr(info, "pss", getattr(info, "uss", info.rss))
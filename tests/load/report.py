@@ -0,0 +1,189 @@
+import math
+
+from pydantic import BaseModel, ConfigDict
+
+MB = 1024 * 1024
+
+
+class LoadConfig(BaseModel):
+    """Parameters of one load run"""
+
+    model_config = ConfigDict(use_attribute_docstrings=True)
+
+    concurrency: int = 4
+    """Number of simultaneous clients hitting the app"""
+
+    duration: float = 300
+    """Measured load duration, seconds"""
+
+    warmup: float = 10
+    """Unmeasured load before the memory baseline is taken, seconds"""
+
+    settle: float = 5
+    """Idle time before memory baseline and leak checks, seconds"""
+
+    sample_interval: float = 1
+    """How often memory of the app process tree is sampled, seconds"""
+
+    download_ratio: float = 0.5
+    """Share of requests going to `/video/download`, the rest go to `/search`"""
+
+    request_timeout: float = 60
+    """Requests taking longer are counted as errors (e.g. spinning search retries)"""
+
+    video_size_kb: int = 512
+    """Size of the video served by the stub CDN"""
+
+    app_port: int = 8765
+    stub_port: int = 8766
+
+    max_memory_growth_mb: float = 50
+    """Fail if idle memory after the run exceeds idle memory before it by this much"""
+
+    max_error_rate: float = 0.01
+    """Fail if share of failed requests is higher"""
+
+    app_log: str | None = None
+    """File to write app output to, discarded if not set"""
+
+
+class EndpointStats(BaseModel):
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+class MemorySample(BaseModel):
+    elapsed: float
+    memory_bytes: int
+    processes: int
+
+
+class LeakCounts(BaseModel):
+    """Leftovers in the app process tree once it is idle"""
+
+    drivers: int = 0
+    """Playwright driver (node) processes"""
+
+    browsers: int = 0
+    """Chromium browser processes"""
+
+    pages: int = 0
+    """Chromium renderer processes"""
+
+    zombies: int = 0
+    """Exited but not reaped child processes"""
+
+    connections: int = 0
+    """Open TCP connections to the stub Douyin site / CDN"""
+
+    @property
+    def total(self) -> int:
+        return (
+            self.drivers + self.browsers + self.pages + self.zombies + self.connections
+        )
+
+
+class LoadReport(BaseModel):
+    config: LoadConfig
+    elapsed: float
+    endpoints: dict[str, EndpointStats]
+    baseline_memory: MemorySample
+    final_memory: MemorySample
+    samples: list[MemorySample]
+    leaks: LeakCounts
+    app_error: str | None = None
+    """Set if the app exited before the run finished"""
+
+    @property
+    def requests(self) -> int:
+        return sum(e.requests for e in self.endpoints.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(e.errors for e in self.endpoints.values())
+
+    @property
+    def requests_per_sec(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def memory_growth_mb(self) -> float:
+        return (self.final_memory.memory_bytes - self.baseline_memory.memory_bytes) / MB
+
+    @property
+    def peak_memory_mb(self) -> float:
+        memory = [s.memory_bytes for s in self.samples] or [
+            self.final_memory.memory_bytes
+        ]
+        return max(memory) / MB
+
+    @property
+    def failures(self) -> list[str]:
+        """Reasons for the run to be considered failed, empty if it passed"""
+        failures = []
+        if self.app_error:
+            failures.append(self.app_error)
+        if self.leaks.total:
+            failures.append(f"leaked resources: {self.leaks.model_dump()}")
+        if self.memory_growth_mb > self.config.max_memory_growth_mb:
+            failures.append(
+                f"Memory grew by {self.memory_growth_mb:.1f} MB "
+                f"(max {self.config.max_memory_growth_mb} MB)"
+            )
+        if self.requests == 0:
+            failures.append("no requests completed")
+        elif self.errors / self.requests > self.config.max_error_rate:
+            failures.append(
+                f"error rate {self.errors / self.requests:.2%} "
+                f"(max {self.config.max_error_rate:.2%})"
+            )
+        return failures
+
+    def render(self) -> str:
+        lines = [
+            f"Load run: {self.elapsed:.0f}s at concurrency {self.config.concurrency}, "
+            f"{self.requests} requests ({self.requests_per_sec:.2f} req/s)",
+            f"{'endpoint':<18}{'requests':>10}{'errors':>8}"
+            f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}",
+        ]
+        for name, e in self.endpoints.items():
+            lines.append(
+                f"{name:<18}{e.requests:>10}{e.errors:>8}"
+                f"{e.p50_ms:>10.0f}{e.p95_ms:>10.0f}{e.p99_ms:>10.0f}"
+            )
+        lines.append(
+            f"Memory (PSS): baseline {self.baseline_memory.memory_bytes / MB:.1f} MB, "
+            f"final {self.final_memory.memory_bytes / MB:.1f} MB "
+            f"({self.memory_growth_mb:+.1f} MB), peak {self.peak_memory_mb:.1f} MB"
+        )
+        lines.append(
+            "Leaks: "
+            + ", ".join(f"{k} {v}" for k, v in self.leaks.model_dump().items())
+        )
+        failures = self.failures
+        lines.append("FAILED: " + "; ".join(failures) if failures else "PASSED")
+        return "\n".join(lines)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile, 0 for no values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def endpoint_stats(results: list[tuple[float, bool]]) -> EndpointStats:
+    """Summarize `(latency in seconds, succeeded)` pairs of one endpoint"""
+    latencies = [latency * 1000 for latency, ok in results if ok]
+    return EndpointStats(
+        requests=len(results),
+        errors=sum(1 for _, ok in results if not ok),
+        p50_ms=percentile(latencies, 50),
+        p95_ms=percentile(latencies, 95),
+        p99_ms=percentile(latencies, 99),
+    )
@@ -0,0 +1,69 @@
+import pytest
+
+from tests.load.report import (
+    MB,
+    LeakCounts,
+    LoadConfig,
+    LoadReport,
+    MemorySample,
+    endpoint_stats,
+    percentile,
+)
+
+
+def make_report(
+    memory_growth: int = 0,
+    leaks: LeakCounts | None = None,
+    errors: int = 0,
+    app_error: str | None = None,
+) -> LoadReport:
+    results = [(0.1, True)] * (100 - errors) + [(60.0, False)] * errors
+    return LoadReport(
+        config=LoadConfig(max_memory_growth_mb=50, max_error_rate=0.01),
+        elapsed=10,
+        endpoints={"/search": endpoint_stats(results)},
+        baseline_memory=MemorySample(elapsed=0, memory_bytes=100 * MB, processes=1),
+        final_memory=MemorySample(
+            elapsed=15, memory_bytes=(100 + memory_growth) * MB, processes=1
+        ),
+        samples=[],
+        leaks=leaks or LeakCounts(),
+        app_error=app_error,
+    )
+
+
+class TestLoadReport:
+    @pytest.mark.parametrize(
+        "pct, expected", [(50, 50), (95, 95), (99, 99), (100, 100), (0, 1)]
+    )
+    def test_percentile(self, pct: float, expected: float) -> None:
+        """Nearest-rank percentile over 1..100"""
+        assert percentile([float(v) for v in range(100, 0, -1)], pct) == expected
+
+    def test_endpoint_stats_ignore_failed_latency(self) -> None:
+        """Failed requests are counted as errors, not as latency"""
+        stats = endpoint_stats([(0.1, True), (0.2, True), (60.0, False)])
+        assert (stats.requests, stats.errors) == (3, 1)
+        assert stats.p99_ms == pytest.approx(200)
+
+    def test_clean_run_passes(self) -> None:
+        report = make_report(memory_growth=10)
+        assert report.failures == []
+        assert report.requests_per_sec * report.elapsed == report.requests
+        assert report.render().endswith("PASSED")
+
+    @pytest.mark.parametrize(
+        "report",
+        [
+            make_report(memory_growth=51),
+            make_report(leaks=LeakCounts(pages=1)),
+            make_report(leaks=LeakCounts(browsers=1, drivers=1)),
+            make_report(leaks=LeakCounts(connections=2)),
+            make_report(leaks=LeakCounts(zombies=1)),
+            make_report(errors=2),
+            make_report(app_error="App exited with code 1"),
+        ],
+    )
+    def test_leaks_growth_and_errors_fail(self, report: LoadReport) -> None:
+        assert len(report.failures) == 1
+        assert "FAILED" in report.render()
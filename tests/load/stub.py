@@ -0,0 +1,84 @@
+import threading
+import time
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, StreamingResponse
+
+CHUNK_SIZE = 64 * 1024
+
+
+def create_stub_app(video_size: int) -> FastAPI:
+    """Local stand-in for Douyin search/video pages and its video CDN
+
+    Search results are built from the example video cards used by parser tests,
+    so the real parser runs against them.
+
+    Args:
+        video_size (int): number of bytes served for every video
+    """
+    app = FastAPI()
+
+    cards = []
+    for name in ("input_1.html", "input_2.html"):
+        with open(f"tests/example/search_video_card/{name}") as f:
+            cards.append(f.read())
+    search_page = (
+        "<html><body><div id='waterFallScrollContainer'>"
+        + "".join(cards)
+        + "</div></body></html>"
+    )
+
+    @app.get("/search/{query}", response_class=HTMLResponse)
+    async def search(query: str):
+        return search_page
+
+    @app.get("/video/{id}", response_class=HTMLResponse)
+    async def video(request: Request, id: int):
+        src = request.url_for("cdn", id=id)
+        return f"<html><body><video><source src='{src}'></video></body></html>"
+
+    @app.get("/cdn/{id}.mp4", name="cdn")
+    async def cdn(id: int):
+        async def chunks():
+            sent = 0
+            while sent < video_size:
+                size = min(CHUNK_SIZE, video_size - sent)
+                sent += size
+                yield b"\0" * size
+
+        return StreamingResponse(chunks(), media_type="video/mp4")
+
+    return app
+
+
+class StubServer:
+    """Runs the stub site with uvicorn in a background thread"""
+
+    def __init__(self, port: int, video_size: int):
+        self.port = port
+        self._server = uvicorn.Server(
+            uvicorn.Config(
+                create_stub_app(video_size),
+                host="127.0.0.1",
+                port=port,
+                log_level="warning",
+            )
+        )
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self, timeout: float = 10) -> None:
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError(f"Stub server failed to start on port {self.port}")
+            time.sleep(0.05)
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        self._thread.join()